@@ -4,8 +4,18 @@ Analyze clothing data to identify items that need cleaning.
 """
 
 import json
+import re
 from collections import defaultdict, Counter
 
+# Garment words that suggest several items were OCR'd into one name
+COMBINED_ITEM_RE = re.compile(r' (?:trouser|polo|shirt|blazer) ', re.IGNORECASE)
+BEAMS_KHAKI_RE = re.compile(r'beams khaki', re.IGNORECASE)
+
+# Common luxury brands, checked in this order
+BRANDS = ['Saint Laurent', 'Boglioli', 'Lardini', 'The Row', 'Dries', 'Prada',
+          'Zegna', 'Brioni', 'Valentino', 'Loro Piana', 'Iris Von Arnim']
+BRANDS_LOWER = [(brand, brand.lower()) for brand in BRANDS]
+
 def load_data():
     with open('clothing_index.json', 'r') as f:
         clothing_index = json.load(f)
@@ -34,14 +44,14 @@ def main():
     
     # Items that seem to combine multiple things
     combined_items = [item for item in clothing_index.keys() if 
-                     any(word in item.lower() for word in [' trouser ', ' polo ', ' shirt ', ' blazer ']) and
+                     COMBINED_ITEM_RE.search(item) and
                      len(item.split()) > 6]
     print(f"   Combined items ({len(combined_items)}):")
     for item in combined_items[:10]:
         print(f"     - {item}")
     
     # Items with "Beams khaki" (seems to be a trouser)
-    beams_items = [item for item in clothing_index.keys() if 'beams khaki' in item.lower()]
+    beams_items = [item for item in clothing_index.keys() if BEAMS_KHAKI_RE.search(item)]
     print(f"\n   Items with 'Beams khaki' ({len(beams_items)}) - likely should be trouser:")
     for item in beams_items:
         print(f"     - {item}")
@@ -84,11 +94,9 @@ def main():
     for item in clothing_index.keys():
         words = item.split()
         if words:
-            # Common luxury brands
-            brands = ['Saint Laurent', 'Boglioli', 'Lardini', 'The Row', 'Dries', 'Prada', 
-                     'Zegna', 'Brioni', 'Valentino', 'Loro Piana', 'Iris Von Arnim']
-            for brand in brands:
-                if brand.lower() in item.lower():
+            item_lower = item.lower()
+            for brand, brand_lower in BRANDS_LOWER:
+                if brand_lower in item_lower:
                     brand_counts[brand] += 1
                     break
     
@@ -4,9 +4,10 @@ Web interface to manage all collections - categorize seasons, delete pages.
 """
 
 from flask import Flask, render_template_string, request, jsonify, send_from_directory
-import json
 from pathlib import Path
 
+from json_io import dump_json, load_json
+
 app = Flask(__name__)
 
 # Collection configs
@@ -544,20 +545,19 @@ def load_collection_data(collection):
     config = COLLECTIONS[collection]
     filepath = config['page_items_file']
     if Path(filepath).exists():
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return load_json(filepath)
     return {}
 
 def save_collection_data(collection, data):
     """Save page items for a collection."""
     config = COLLECTIONS[collection]
-    with open(config['page_items_file'], 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_json(config['page_items_file'], data)
 
 def rebuild_index(collection, page_items):
     """Rebuild clothing index from page_items."""
     config = COLLECTIONS[collection]
-    clothing_index = {}
+    # Sets make the per-item duplicate page check O(1) instead of a list scan
+    item_pages = {}
 
     for page, items in page_items.items():
         page_num = int(page.replace('page_', ''))
@@ -568,17 +568,12 @@ def rebuild_index(collection, page_items):
             else:
                 name = item
 
-            if name not in clothing_index:
-                clothing_index[name] = []
-            if page_num not in clothing_index[name]:
-                clothing_index[name].append(page_num)
+            item_pages.setdefault(name, set()).add(page_num)
 
     # Sort page numbers
-    for name in clothing_index:
-        clothing_index[name].sort()
+    clothing_index = {name: sorted(pages) for name, pages in item_pages.items()}
 
-    with open(config['clothing_index_file'], 'w') as f:
-        json.dump(clothing_index, f, indent=2)
+    dump_json(config['clothing_index_file'], clothing_index)
 
 @app.route('/')
 def index():
@@ -672,10 +667,11 @@ def save_collection(collection):
     for target_collection, pages in pages_to_move.items():
         target_data = load_collection_data(target_collection)
 
+        # Find next available page number in target once, then count up
+        next_num = max((int(p.replace('page_', '')) for p in target_data), default=0)
+
         for page, items, season in pages:
-            # Find next available page number in target
-            existing_nums = [int(p.replace('page_', '')) for p in target_data.keys()]
-            next_num = max(existing_nums, default=0) + 1
+            next_num += 1
             new_page = f'page_{next_num}'
 
             # Convert items to target format and set season
@@ -279,8 +279,8 @@ def save():
     page_seasons = load_page_seasons()
     if season:
         page_seasons[page] = season
-    elif page in page_seasons:
-        del page_seasons[page]
+    else:
+        page_seasons.pop(page, None)
 
     save_page_seasons(page_seasons)
     return jsonify({"status": "ok"})
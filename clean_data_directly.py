@@ -4,23 +4,24 @@ Direct data cleaning script - edit this file to clean your clothing data.
 Run this script after making your edits to apply the changes.
 """
 
-import json
 from collections import defaultdict
 
+from json_io import dump_json, load_json
+from page_utils import intern_page, page_sort_key
+
 def load_data():
     """Load current data"""
-    with open('clothing_index.json', 'r') as f:
-        clothing_index = json.load(f)
-    with open('page_items.json', 'r') as f:
-        page_items = json.load(f)
+    clothing_index = load_json('clothing_index.json')
+    page_items = load_json('page_items.json')
+    clothing_index = {item: [intern_page(page) for page in pages]
+                      for item, pages in clothing_index.items()}
+    page_items = {intern_page(page): items for page, items in page_items.items()}
     return clothing_index, page_items
 
 def save_data(clothing_index, page_items):
     """Save cleaned data"""
-    with open('clothing_index.json', 'w') as f:
-        json.dump(clothing_index, f, indent=2)
-    with open('page_items.json', 'w') as f:
-        json.dump(page_items, f, indent=2)
+    dump_json('clothing_index.json', clothing_index)
+    dump_json('page_items.json', page_items)
 
 def rename_item(clothing_index, page_items, old_name, new_name):
     """Rename an item throughout the dataset"""
@@ -44,21 +45,22 @@ def merge_items(clothing_index, page_items, items_to_merge, new_name):
     
     # Collect all pages
     for item in items_to_merge:
-        if item in clothing_index:
-            all_pages.update(clothing_index[item])
-            del clothing_index[item]
+        pages = clothing_index.pop(item, None)
+        if pages is not None:
+            all_pages.update(pages)
         else:
             print(f"⚠️  Item not found: '{item}'")
     
     # Create merged item
-    clothing_index[new_name] = sorted(list(all_pages))
+    clothing_index[new_name] = sorted(all_pages, key=page_sort_key)
     
     # Update page items
+    merge_set = frozenset(items_to_merge)
     for page, items in page_items.items():
         updated_items = []
         merged_added = False
         for item in items:
-            if item in items_to_merge:
+            if isinstance(item, str) and item in merge_set:
                 if not merged_added:
                     updated_items.append(new_name)
                     merged_added = True
@@ -70,9 +72,7 @@ def merge_items(clothing_index, page_items, items_to_merge, new_name):
 
 def delete_item(clothing_index, page_items, item_name):
     """Delete an item completely"""
-    if item_name in clothing_index:
-        del clothing_index[item_name]
-        
+    if clothing_index.pop(item_name, None) is not None:
         # Remove from page items
         for page, items in page_items.items():
             if item_name in items:
@@ -4,18 +4,40 @@ Script to clean OCR artifacts and merge items with leading characters.
 Specifically targeting variations of "The Row brown tassel loafer"
 """
 
-import json
+import argparse
 import re
+import sys
 
-def clean_spring_data():
-    """Clean Spring collection data"""
+from json_io import dump_json, load_json
+from page_utils import intern_page, page_sort_key
+
+
+def clean_item_name(item_name):
+    """Strip leading OCR artifacts from a page item name"""
+    # Remove leading OCR artifacts (single letters, special chars followed by space)
+    cleaned_name = re.sub(r'^[a-z]\s+The Row', 'The Row', item_name, flags=re.IGNORECASE)
+    cleaned_name = re.sub(r'^[^\w]+\s*The Row', 'The Row', cleaned_name)
+    cleaned_name = re.sub(r'^of\s+The Row', 'The Row', cleaned_name)
+    cleaned_name = re.sub(r'^[eE][sS]\)\s*Saint Laurent', 'Saint Laurent', cleaned_name)
+    cleaned_name = re.sub(r'^[iI]c\s+Saint Laurent', 'Saint Laurent', cleaned_name)
+    cleaned_name = re.sub(r'^[""]\.\s*The Row', 'The Row', cleaned_name)
+    
+    # Also clean any other common OCR artifacts
+    cleaned_name = re.sub(r'^\W+\s*', '', cleaned_name)  # Remove leading non-word chars
+    cleaned_name = re.sub(r'\s+', ' ', cleaned_name)  # Normalize spaces
+    return cleaned_name
+
+def clean_spring_data(verbose=False):
+    """Clean Spring collection data (verbose lists every renamed page item)"""
     
     # Load Spring data
-    with open('clothing_index_spring.json', 'r') as f:
-        index = json.load(f)
+    index = load_json('clothing_index_spring.json')
+    page_items = load_json('page_items_spring.json')
     
-    with open('page_items_spring.json', 'r') as f:
-        page_items = json.load(f)
+    # Intern page ids so the set merges below hash each id once and compare
+    # equal ids by identity
+    index = {item: [intern_page(page) for page in pages] for item, pages in index.items()}
+    page_items = {intern_page(page): items for page, items in page_items.items()}
     
     # Items to merge - variations of The Row brown tassel loafer
     artifacts_to_clean = [
@@ -38,6 +60,7 @@ def clean_spring_data():
     
     # Create cleaned index
     cleaned_index = {}
+    merged_pages = {}  # item -> set of pages, for entries that received a merge
     merge_count = 0
     
     for item, pages in index.items():
@@ -46,7 +69,7 @@ def clean_spring_data():
             canonical = canonical_names[item]
             if canonical in cleaned_index:
                 # Add pages to existing canonical entry
-                cleaned_index[canonical].extend(pages)
+                merged_pages.setdefault(canonical, set(cleaned_index[canonical])).update(pages)
                 print(f"Merging '{item}' -> '{canonical}' ({len(pages)} pages)")
             else:
                 # Start new canonical entry
@@ -57,54 +80,46 @@ def clean_spring_data():
             # Keep as is
             if item in cleaned_index:
                 # Already exists (shouldn't happen but just in case)
-                cleaned_index[item].extend(pages)
+                merged_pages.setdefault(item, set(cleaned_index[item])).update(pages)
             else:
                 cleaned_index[item] = pages
     
-    # Sort and deduplicate pages for merged items
-    for item in cleaned_index:
-        pages = list(set(cleaned_index[item]))
-        cleaned_index[item] = sorted(pages, key=lambda x: int(x.split('_')[1]))
+    # Sort the deduplicated pages once, only for items that received a merge
+    # (every other entry is still sorted as loaded)
+    for item, pages in merged_pages.items():
+        cleaned_index[item] = sorted(pages, key=page_sort_key)
     
-    # Clean page_items
+    # Clean page_items in place (only renamed items are touched); names repeat
+    # across pages, so map each one once
+    cleaned_names = {}
+    page_updates = []  # (page, old name, new name), reported after the loop
     for page, items in page_items.items():
-        cleaned_items = []
         for item in items:
             if isinstance(item, dict):
                 item_name = item['name']
-                category = item['category']
                 
-                # Clean the name
-                # Remove leading OCR artifacts (single letters, special chars followed by space)
-                cleaned_name = re.sub(r'^[a-z]\s+The Row', 'The Row', item_name, flags=re.IGNORECASE)
-                cleaned_name = re.sub(r'^[^\w]+\s*The Row', 'The Row', cleaned_name)
-                cleaned_name = re.sub(r'^of\s+The Row', 'The Row', cleaned_name)
-                cleaned_name = re.sub(r'^[eE][sS]\)\s*Saint Laurent', 'Saint Laurent', cleaned_name)
-                cleaned_name = re.sub(r'^[iI]c\s+Saint Laurent', 'Saint Laurent', cleaned_name)
-                cleaned_name = re.sub(r'^[""]\.\s*The Row', 'The Row', cleaned_name)
-                
-                # Also clean any other common OCR artifacts
-                cleaned_name = re.sub(r'^\W+\s*', '', cleaned_name)  # Remove leading non-word chars
-                cleaned_name = re.sub(r'\s+', ' ', cleaned_name)  # Normalize spaces
+                # Clean the name (each distinct name only once)
+                cleaned = cleaned_names.get(item_name)
+                if cleaned is None:
+                    cleaned_name = clean_item_name(item_name)
+                    cleaned = cleaned_names[item_name] = (cleaned_name, cleaned_name.strip())
+                cleaned_name, new_name = cleaned
                 
                 if cleaned_name != item_name:
-                    print(f"  Page {page}: '{item_name}' -> '{cleaned_name}'")
-                
-                cleaned_items.append({
-                    'name': cleaned_name.strip(),
-                    'category': category
-                })
-            else:
-                cleaned_items.append(item)
-        
-        page_items[page] = cleaned_items
+                    page_updates.append((page, item_name, cleaned_name))
+                if new_name != item_name:
+                    item['name'] = new_name
     
     # Save cleaned data
-    with open('clothing_index_spring.json', 'w') as f:
-        json.dump(cleaned_index, f, indent=2)
+    dump_json('clothing_index_spring.json', cleaned_index)
+    dump_json('page_items_spring.json', page_items)
     
-    with open('page_items_spring.json', 'w') as f:
-        json.dump(page_items, f, indent=2)
+    if verbose and page_updates:
+        sys.stdout.write(''.join(
+            f"  Page {page}: '{old}' -> '{new}'\n" for page, old, new in page_updates
+        ))
+    print(f"Cleaned {len(page_updates)} page item names "
+          f"on {len({page for page, _, _ in page_updates})} pages")
     
     print(f"\n✅ Cleaning complete!")
     print(f"Merged {merge_count} artifact entries")
@@ -116,11 +131,15 @@ def clean_spring_data():
         print(f"\n'The Row brown tassel loafer' now appears on {len(pages)} pages")
 
 def main():
+    parser = argparse.ArgumentParser(description="Clean OCR artifacts in the Spring collection")
+    parser.add_argument("--verbose", action="store_true", help="List every renamed page item")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("Cleaning OCR artifacts in Spring collection...")
     print("=" * 60)
     
-    clean_spring_data()
+    clean_spring_data(verbose=args.verbose)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -264,7 +264,7 @@ class ClothingExtractor(ABC):
                 for item in items:
                     item_key = f"{item.name} ({item.category})"
                     self.clothing_index[item_key].append(page_num)
-                    self.category_stats.increment(item.category)
+                self.category_stats.update(item.category for item in items)
 
                 if self.verbose:
                     print(f"  Found {len(items)} items")
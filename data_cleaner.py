@@ -5,29 +5,27 @@ Allows manual editing, merging, and cleaning of extracted clothing data.
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
-import json
 import os
 from collections import defaultdict
 
+from json_io import dump_json, load_json
+from page_utils import page_sort_key
+
 app = Flask(__name__)
 
 def load_data():
     """Load clothing index and page items from JSON files"""
     try:
-        with open('clothing_index.json', 'r') as f:
-            clothing_index = json.load(f)
-        with open('page_items.json', 'r') as f:
-            page_items = json.load(f)
+        clothing_index = load_json('clothing_index.json')
+        page_items = load_json('page_items.json')
         return clothing_index, page_items
     except FileNotFoundError:
         return {}, {}
 
 def save_data(clothing_index, page_items):
     """Save cleaned data back to JSON files"""
-    with open('clothing_index.json', 'w') as f:
-        json.dump(clothing_index, f, indent=2)
-    with open('page_items.json', 'w') as f:
-        json.dump(page_items, f, indent=2)
+    dump_json('clothing_index.json', clothing_index)
+    dump_json('page_items.json', page_items)
 
 @app.route('/clean')
 def data_cleaner():
@@ -56,9 +54,7 @@ def rename_item():
     
     if old_name in clothing_index and old_name != new_name:
         # Update clothing index
-        pages = clothing_index[old_name]
-        del clothing_index[old_name]
-        clothing_index[new_name] = pages
+        clothing_index[new_name] = clothing_index.pop(old_name)
         
         # Update page items
         for page, items in page_items.items():
@@ -82,19 +78,20 @@ def merge_items():
     # Collect all pages from items to merge
     all_pages = set()
     for item in items_to_merge:
-        if item in clothing_index:
-            all_pages.update(clothing_index[item])
-            del clothing_index[item]
+        pages = clothing_index.pop(item, None)
+        if pages is not None:
+            all_pages.update(pages)
     
     # Create merged item
-    clothing_index[target_name] = sorted(list(all_pages))
+    clothing_index[target_name] = sorted(all_pages, key=page_sort_key)
     
     # Update page items
+    merge_set = frozenset(items_to_merge)
     for page, items in page_items.items():
         updated_items = []
         merged_added = False
         for item in items:
-            if item in items_to_merge:
+            if isinstance(item, str) and item in merge_set:
                 if not merged_added:
                     updated_items.append(target_name)
                     merged_added = True
@@ -113,9 +110,7 @@ def delete_item():
     
     clothing_index, page_items = load_data()
     
-    if item_name in clothing_index:
-        del clothing_index[item_name]
-        
+    if clothing_index.pop(item_name, None) is not None:
         # Remove from page items
         for page, items in page_items.items():
             if item_name in items:
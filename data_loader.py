@@ -4,13 +4,13 @@ Data loader with validation for Kevin's Outfit Finder.
 Loads JSON data and validates using Pydantic models.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 
 from config import DATA_FILES, PAGE_SEASONS_FILE
+import json_io
 from models import ClothingItem, CollectionData
 
 
@@ -18,8 +18,7 @@ def load_json(file_path: Path) -> Dict:
     """Load JSON file with error handling."""
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_io.load_json(file_path)
 
 
 def load_collection(collection: str, validate: bool = True) -> CollectionData:
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+File copy helpers shared by the static site generator and image optimizer.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy file contents from src to dst (no metadata).
+
+    Uses os.copy_file_range for an in-kernel copy where available (Linux),
+    falling back to shutil.copyfile elsewhere or if the kernel refuses.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Hardlink src to dst, copying instead if linking isn't possible
+    (e.g. dst is on another filesystem).
+
+    An existing dst is unlinked first rather than overwritten, so a dst that
+    is already a hardlink to src never gets truncated.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        fast_copy(src, dst)
@@ -8,12 +8,18 @@ Features:
 - Unified categorized data format
 - Separate Fall and Winter tabs (using page_seasons_fw.json)
 - Templates loaded from external files
+- index.html only regenerated when data or templates change
+- Collection data fetched on demand instead of inlined in the page
 """
 
-import json
+import functools
+import hashlib
+import os
+import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Set, Union
 
 from config import (
     DATA_FILES,
@@ -24,10 +30,43 @@ from config import (
     CATEGORY_ICONS,
     PAGE_SEASONS_FILE,
 )
+from file_utils import link_or_copy
+import json_io
 
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Image copies (hardlinks where possible) are I/O-bound, so overlap them across a few threads
+IMAGE_COPY_WORKERS = 8
+
+# Escapes item names for HTML text and double-quoted attribute values
+HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;',
+})
+
+# Escapes item names for a single-quoted JS string inside an onclick="..." attribute
+ONCLICK_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\', "'": "\\'",
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+})
+
+# Collections with fewer items than this render categories serially
+PARALLEL_RENDER_MIN_ITEMS = 500
+
+# Memoize rendered category sections across regenerations in one process
+# (e.g. a watch loop or tests). Off by default: a one-shot build never
+# repeats a section, so the cache would only add overhead.
+RENDER_CACHE_ENABLED = False
+
+# Per-collection JSON fetched lazily by the page
+DIST_DATA_DIR = DIST_DIR / "data"
+
+# Fingerprint of the inputs index.html was last built from
+BUILD_HASH_FILE = DIST_DIR / ".build_hash"
+
+# Matches "{{ name }}" placeholders in templates
+PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}")
+
 
 def load_template(name: str) -> str:
     """Load a template file."""
@@ -37,35 +76,41 @@ def load_template(name: str) -> str:
     raise FileNotFoundError(f"Template not found: {template_path}")
 
 
-def load_page_seasons() -> Dict[str, str]:
-    """Load the page seasons mapping (page -> 'fall' or 'winter')."""
-    if PAGE_SEASONS_FILE.exists():
-        with open(PAGE_SEASONS_FILE, 'r') as f:
-            return json.load(f)
-    return {}
-
+def iter_template(template: str, context: Dict[str, Union[str, Iterable[str]]]) -> Iterator[str]:
+    """
+    Render a template chunk by chunk.
 
-def load_collection_data(collection: str) -> Tuple[Dict, Dict, Optional[Dict]]:
-    """Load clothing data for a specific collection."""
-    files = DATA_FILES.get(collection, {})
+    Each "{{ name }}" placeholder is replaced by context[name], which may be a
+    string or an iterable of strings (e.g. a generator). Unknown placeholders
+    are left untouched.
+    """
+    parts = PLACEHOLDER_RE.split(template)
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            if part:
+                yield part
+            continue
 
-    clothing_index = {}
-    page_items = {}
-    category_stats = None
+        value = context.get(part)
+        if value is None:
+            yield "{{ " + part + " }}"
+        elif isinstance(value, str):
+            yield value
+        else:
+            yield from value
 
-    if "clothing_index" in files and files["clothing_index"].exists():
-        with open(files["clothing_index"], 'r') as f:
-            clothing_index = json.load(f)
 
-    if "page_items" in files and files["page_items"].exists():
-        with open(files["page_items"], 'r') as f:
-            page_items = json.load(f)
+def load_json(path: Path, default: Any = None) -> Any:
+    """Load a JSON file, returning default if it doesn't exist."""
+    if not path.exists():
+        return default
+    return json_io.loads(path.read_bytes())
 
-    if "category_stats" in files and files["category_stats"].exists():
-        with open(files["category_stats"], 'r') as f:
-            category_stats = json.load(f)
 
-    return clothing_index, page_items, category_stats
+def load_json_files(paths: List[Path]) -> List[Any]:
+    """Load several JSON files concurrently; missing files load as {}."""
+    with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as executor:
+        return list(executor.map(lambda path: load_json(path, {}), paths))
 
 
 def filter_by_season(clothing_index: Dict, page_items: Dict, season: str, page_seasons: Dict[str, str]) -> Tuple[Dict, Dict]:
@@ -91,10 +136,15 @@ def filter_by_season(clothing_index: Dict, page_items: Dict, season: str, page_s
     return filtered_clothing_index, filtered_page_items
 
 
-def categorize_items(clothing_index: Dict[str, List], collection: str, page_items: Dict = None) -> Dict[str, List[Tuple[str, List, str]]]:
+# (-page_count, position, item_name, pages, category): plain tuple comparison
+# orders by page count descending, ties keeping clothing_index order
+CategorizedItem = Tuple[int, int, str, List, str]
+
+
+def categorize_items(clothing_index: Dict[str, List], collection: str, page_items: Dict = None) -> Dict[str, List[CategorizedItem]]:
     """Categorize items using category data from the item names or page_items."""
     categories = CATEGORY_ORDER.get(collection, CATEGORY_ORDER["summer"])
-    categorized: Dict[str, List[Tuple[str, List, str]]] = {cat: [] for cat in categories}
+    categorized: Dict[str, List[CategorizedItem]] = {cat: [] for cat in categories}
 
     # Build item->category lookup from page_items if available
     item_category_lookup = {}
@@ -104,146 +154,266 @@ def categorize_items(clothing_index: Dict[str, List], collection: str, page_item
                 if isinstance(item_data, dict) and 'name' in item_data and 'category' in item_data:
                     item_category_lookup[item_data['name']] = item_data['category']
 
-    for item, pages in clothing_index.items():
+    for position, (item, pages) in enumerate(clothing_index.items()):
         if item in item_category_lookup:
             item_name = item
             category = item_category_lookup[item]
-        elif '(' in item and ')' in item:
-            category = item[item.rfind('(')+1:item.rfind(')')]
-            item_name = item[:item.rfind('(')].strip()
         else:
-            item_name = item
+            # Split "Item Name (Category)" keys in one pass
+            head, sep, tail = item.rpartition('(')
+            if sep and tail.endswith(')'):
+                item_name = head.strip()
+                category = tail[:-1]
+            else:
+                item_name = item
+                category = "Other"
+
+        if category not in categorized:
             category = "Other"
+        categorized[category].append((-len(pages), position, item_name, pages, category))
 
-        if category in categorized:
-            categorized[category].append((item_name, pages, category))
-        else:
-            categorized["Other"].append((item_name, pages, "Other"))
-
-    for category in categorized:
-        categorized[category].sort(key=lambda x: len(x[1]), reverse=True)
+    for items in categorized.values():
+        items.sort()
 
     return categorized
 
 
-def generate_collection_html(collection_name: str, clothing_index: Dict, page_items: Dict, image_folder: str) -> str:
-    """Generate HTML for a specific collection."""
-    collection_key = collection_name.lower().replace("/", "")
-    if collection_key == "fallwinter":
-        collection_key = "fw"
+def render_section(category: str, entries: Tuple[Tuple[str, int], ...], collection_name: str, image_folder: str) -> str:
+    """Render one category section from (item_name, page_count) entries."""
+    icon = CATEGORY_ICONS.get(category, '📦')
 
-    categorized_items = categorize_items(clothing_index, collection_key, page_items)
-    category_order = CATEGORY_ORDER.get(collection_key, CATEGORY_ORDER["summer"])
-
-    category_sections = []
-    for category in category_order:
-        if category not in categorized_items or not categorized_items[category]:
-            continue
+    # Trailing showItemDetail() arguments are the same for every item card
+    detail_args = f"'{collection_name}', '{image_folder}'"
 
-        items = categorized_items[category]
-        icon = CATEGORY_ICONS.get(category, '📦')
-
-        section_html = f"""
+    section_html = f"""
                     <div class="category-section">
                         <div class="category-header">
                             <h2>{icon} {category}</h2>
-                            <p class="category-description">{len(items)} items in this category</p>
+                            <p class="category-description">{len(entries)} items in this category</p>
                         </div>
                         <div class="item-grid">"""
 
-        for item_name, pages, _ in items:
-            escaped_item = item_name.replace("'", "\\'").replace('"', '\\"')
-            section_html += f"""
-                            <div class="item-card" data-item-name="{item_name}" onclick="showItemDetail('{escaped_item}', '{collection_name}', '{image_folder}')">
-                                <div class="item-name">{item_name}</div>
+    for item_name, page_count in entries:
+        html_item = item_name.translate(HTML_ESCAPE_TABLE)
+        onclick_item = item_name.translate(ONCLICK_ESCAPE_TABLE)
+        section_html += f"""
+                            <div class="item-card" data-item-name="{html_item}" onclick="showItemDetail('{onclick_item}', {detail_args})">
+                                <div class="item-name">{html_item}</div>
                                 <div class="item-count">
-                                    Appears on {len(pages)} page{'s' if len(pages) > 1 else ''}
+                                    Appears on {page_count} page{'s' if page_count > 1 else ''}
                                 </div>
                             </div>"""
 
-        section_html += """
+    section_html += """
                         </div>
                     </div>"""
 
-        category_sections.append(section_html)
+    return section_html
+
+
+# Memoized render_section, used when RENDER_CACHE_ENABLED is set
+cached_render_section = functools.lru_cache(maxsize=64)(render_section)
+
+
+def render_category(category: str, items: List[CategorizedItem], collection_name: str, image_folder: str) -> str:
+    """Render the HTML section for one category of a collection."""
+    # Sections only depend on names and page counts, which are hashable
+    entries = tuple((item_name, len(pages)) for _, _, item_name, pages, _ in items)
+    if RENDER_CACHE_ENABLED:
+        return cached_render_section(category, entries, collection_name, image_folder)
+    return render_section(category, entries, collection_name, image_folder)
+
+
+def iter_collection_html(collection_name: str, clothing_index: Dict, page_items: Dict, image_folder: str) -> Iterator[str]:
+    """
+    Yield the HTML for a specific collection one category section at a time.
 
-    return ''.join(category_sections)
+    Large collections render their categories on a process pool; below
+    PARALLEL_RENDER_MIN_ITEMS the pool startup cost outweighs the gain.
+    """
+    collection_key = collection_name.lower().replace("/", "")
+    if collection_key == "fallwinter":
+        collection_key = "fw"
+
+    categorized_items = categorize_items(clothing_index, collection_key, page_items)
+    category_order = CATEGORY_ORDER.get(collection_key, CATEGORY_ORDER["summer"])
 
+    sections = [
+        (category, categorized_items[category])
+        for category in category_order
+        if categorized_items.get(category)
+    ]
+    total_items = sum(len(items) for _, items in sections)
+
+    if len(sections) < 2 or total_items < PARALLEL_RENDER_MIN_ITEMS:
+        for category, items in sections:
+            yield render_category(category, items, collection_name, image_folder)
+        return
+
+    workers = min(len(sections), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(render_category, category, items, collection_name, image_folder)
+            for category, items in sections
+        ]
+        for future in futures:
+            yield future.result()
+
+
+def load_site_collections() -> Dict[str, Tuple[Dict, Dict]]:
+    """Load (clothing_index, page_items) for each site tab: summer, spring, fall and winter."""
+
+    # Load all collections and the page seasons mapping in one concurrent pass
+    (
+        summer_index, summer_items,
+        spring_index, spring_items,
+        fw_index, fw_items,
+        page_seasons,
+    ) = load_json_files([
+        DATA_FILES['summer']['clothing_index'], DATA_FILES['summer']['page_items'],
+        DATA_FILES['spring']['clothing_index'], DATA_FILES['spring']['page_items'],
+        DATA_FILES['fw']['clothing_index'], DATA_FILES['fw']['page_items'],
+        PAGE_SEASONS_FILE,
+    ])
+
+    # Filter Fall/Winter into separate collections
+    return {
+        'summer': (summer_index, summer_items),
+        'spring': (spring_index, spring_items),
+        'fall': filter_by_season(fw_index, fw_items, 'fall', page_seasons),
+        'winter': filter_by_season(fw_index, fw_items, 'winter', page_seasons),
+    }
 
-def create_all_collections_html() -> str:
-    """Create the main static HTML file with four collections."""
 
-    # Load all collections
-    summer_index, summer_items, _ = load_collection_data('summer')
-    spring_index, spring_items, _ = load_collection_data('spring')
-    fw_index, fw_items, _ = load_collection_data('fw')
+def write_collection_data(collections: Dict[str, Tuple[Dict, Dict]], output_dir: Path) -> int:
+    """
+    Write each collection's index and page items as JSON for the page to fetch.
+
+    Returns the number of files written.
+    """
+    output_dir.mkdir(exist_ok=True)
+    for name, (clothing_index, page_items) in collections.items():
+        for suffix, data in (("index", clothing_index), ("items", page_items)):
+            with open(output_dir / f"{name}_{suffix}.json", 'wb', buffering=1 << 20) as f:
+                f.write(json_io.dumps(data))
+    return 2 * len(collections)
+
+
+def iter_all_collections_html(collections: Optional[Dict[str, Tuple[Dict, Dict]]] = None) -> Iterator[str]:
+    """
+    Yield the main static HTML file with four collections in chunks.
+
+    Collection sections are rendered lazily as the template is consumed, so
+    the full page never has to be held in memory at once. The page fetches
+    item/page data itself (see write_collection_data), so none is inlined.
+    """
+    if collections is None:
+        collections = load_site_collections()
+
+    summer_index, summer_items = collections['summer']
+    spring_index, spring_items = collections['spring']
+    fall_index, fall_items = collections['fall']
+    winter_index, winter_items = collections['winter']
+
+    context: Dict[str, Union[str, Iterable[str]]] = {
+        "css_content": load_template("css/styles.css"),
+        "js_content": load_template("js/app.js"),
+        "summer_html": iter_collection_html('Summer', summer_index, summer_items, 'images'),
+        "spring_html": iter_collection_html('Spring', spring_index, spring_items, 'spring_images'),
+        "fall_html": iter_collection_html('Fall', fall_index, fall_items, 'fw_images'),
+        "winter_html": iter_collection_html('Winter', winter_index, winter_items, 'fw_images'),
+    }
 
-    # Load page seasons and filter Fall/Winter into separate collections
-    page_seasons = load_page_seasons()
-    fall_index, fall_items = filter_by_season(fw_index, fw_items, 'fall', page_seasons)
-    winter_index, winter_items = filter_by_season(fw_index, fw_items, 'winter', page_seasons)
+    yield from iter_template(load_template("index.html"), context)
 
-    # Generate HTML for each collection
-    summer_html = generate_collection_html('Summer', summer_index, summer_items, 'images')
-    spring_html = generate_collection_html('Spring', spring_index, spring_items, 'spring_images')
-    fall_html = generate_collection_html('Fall', fall_index, fall_items, 'fw_images')
-    winter_html = generate_collection_html('Winter', winter_index, winter_items, 'fw_images')
 
-    # Load templates
-    css_content = load_template("css/styles.css")
-    js_content = load_template("js/app.js")
-    html_template = load_template("index.html")
+def build_fingerprint() -> str:
+    """Hash the mtime and size of every input that affects index.html and its data."""
+    script = Path(__file__)
+    # config.py holds the category order/icons and data/image paths
+    inputs = [script, script.with_name('config.py'), script.with_name('json_io.py'), PAGE_SEASONS_FILE]
+    for files in DATA_FILES.values():
+        inputs.extend(files.values())
+    inputs.extend(sorted(p for p in TEMPLATE_DIR.rglob('*') if p.is_file()))
 
-    # Render template with data
-    html_content = html_template
-    html_content = html_content.replace("{{ css_content }}", css_content)
-    html_content = html_content.replace("{{ js_content }}", js_content)
-    html_content = html_content.replace("{{ summer_html }}", summer_html)
-    html_content = html_content.replace("{{ spring_html }}", spring_html)
-    html_content = html_content.replace("{{ fall_html }}", fall_html)
-    html_content = html_content.replace("{{ winter_html }}", winter_html)
-    html_content = html_content.replace("{{ summer_index_json }}", json.dumps(summer_index))
-    html_content = html_content.replace("{{ summer_items_json }}", json.dumps(summer_items))
-    html_content = html_content.replace("{{ spring_index_json }}", json.dumps(spring_index))
-    html_content = html_content.replace("{{ spring_items_json }}", json.dumps(spring_items))
-    html_content = html_content.replace("{{ fall_index_json }}", json.dumps(fall_index))
-    html_content = html_content.replace("{{ fall_items_json }}", json.dumps(fall_items))
-    html_content = html_content.replace("{{ winter_index_json }}", json.dumps(winter_index))
-    html_content = html_content.replace("{{ winter_items_json }}", json.dumps(winter_items))
+    entries = []
+    for path in inputs:
+        if path.exists():
+            stat = path.stat()
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return hashlib.blake2b(repr(entries).encode('utf-8'), digest_size=16).hexdigest()
 
-    return html_content
+
+def prune_stale_images(output_dir: Path, source_stems: Set[str]) -> int:
+    """
+    Delete images in a dist image folder (PNG copies and WebP versions)
+    whose source PNG no longer exists. Returns the number removed.
+    """
+    removed = 0
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and Path(entry.name).stem not in source_stems:
+                os.unlink(entry.path)
+                removed += 1
+    return removed
 
 
 def create_netlify_files_all_collections() -> None:
     """Create necessary files for Netlify deployment with all collections."""
-
-    # Create dist directory
-    if DIST_DIR.exists():
+    fingerprint = build_fingerprint()
+    html_up_to_date = (
+        BUILD_HASH_FILE.exists()
+        and (DIST_DIR / 'index.html').exists()
+        and BUILD_HASH_FILE.read_text() == fingerprint
+    )
+
+    # Create dist directory (kept as-is when index.html is still current)
+    if DIST_DIR.exists() and not html_up_to_date:
         shutil.rmtree(DIST_DIR)
-    DIST_DIR.mkdir()
+    DIST_DIR.mkdir(exist_ok=True)
+    file_count = 0
 
     # Create images directories and copy images
-    for collection, source_dir in COLLECTION_PATHS.items():
-        output_folder = DIST_IMAGE_FOLDERS[collection]
-        output_dir = DIST_DIR / output_folder
-        output_dir.mkdir()
-
-        if source_dir.exists():
-            count = 0
-            for img_file in source_dir.glob('*.png'):
-                shutil.copy2(img_file, output_dir)
-                count += 1
-            print(f"✅ Copied {count} {collection} images")
-
-    # Generate and write main HTML file
-    html_content = create_all_collections_html()
-    with open(DIST_DIR / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    print("✅ Generated index.html with all three collections")
+    with ThreadPoolExecutor(max_workers=IMAGE_COPY_WORKERS) as executor:
+        for collection, source_dir in COLLECTION_PATHS.items():
+            output_folder = DIST_IMAGE_FOLDERS[collection]
+            output_dir = DIST_DIR / output_folder
+            output_dir.mkdir(exist_ok=True)
+
+            source_files = list(source_dir.glob('*.png')) if source_dir.exists() else []
+            # dist/ survives a cache hit, so drop images whose source was deleted
+            removed = prune_stale_images(output_dir, {img_file.stem for img_file in source_files})
+            if removed:
+                print(f"🗑️  Removed {removed} stale {collection} images")
+
+            if source_dir.exists():
+                futures = [
+                    executor.submit(link_or_copy, img_file, output_dir / img_file.name)
+                    for img_file in source_files
+                ]
+                for future in futures:
+                    future.result()
+                file_count += len(futures)
+                print(f"✅ Copied {len(futures)} {collection} images")
+
+    # Stream main HTML file straight to disk and write the per-collection
+    # data it fetches, unless no input has changed
+    if html_up_to_date:
+        print("⏭️  Data and templates unchanged, keeping existing index.html")
+        file_count += sum(1 for _ in DIST_DATA_DIR.glob('*.json'))
+    else:
+        collections = load_site_collections()
+        with open(DIST_DIR / 'index.html', 'w', encoding='utf-8', buffering=1 << 20, newline='') as f:
+            f.writelines(iter_all_collections_html(collections))
+        file_count += write_collection_data(collections, DIST_DATA_DIR)
+        BUILD_HASH_FILE.write_text(fingerprint)
+        print("✅ Generated index.html and collection data with all three collections")
+    file_count += 1
 
     # Create _redirects file in dist
     with open(DIST_DIR / '_redirects', 'w') as f:
         f.write("/*    /index.html   200\n")
+    file_count += 1
     print("✅ Created _redirects")
 
     # Copy all data files to dist for reference
@@ -251,6 +421,7 @@ def create_netlify_files_all_collections() -> None:
         for file_type, file_path in files.items():
             if file_path.exists():
                 shutil.copy2(file_path, DIST_DIR)
+                file_count += 1
     print("✅ Copied all data files")
 
     # Copy favicon files
@@ -259,11 +430,12 @@ def create_netlify_files_all_collections() -> None:
         favicon_path = Path(favicon)
         if favicon_path.exists():
             shutil.copy2(favicon_path, DIST_DIR)
+            file_count += 1
     print("✅ Copied favicon files")
 
     print(f"\n🎉 Static site with all three collections ready for deployment!")
     print(f"📁 Files created in: {DIST_DIR.absolute()}")
-    print(f"📊 Total files: {len(list(DIST_DIR.rglob('*')))}")
+    print(f"📊 Total files: {file_count}")
 
 
 def main() -> None:
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the data scripts and the static site generator.
+Uses orjson when installed and falls back to the standard library, with
+both producing the same bytes.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the standard library
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from UTF-8 bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact or indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def dump_json(path: Union[str, Path], obj: Any) -> bool:
+    """
+    Write obj to a JSON file, indented by 2 spaces.
+
+    Skips the write when the file already holds exactly these bytes, and
+    otherwise writes a temp file and renames it into place, so an interrupted
+    run never leaves a truncated data file. Returns True if the file was written.
+    """
+    path = Path(path)
+    data = dumps(obj, indent=True)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
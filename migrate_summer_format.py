@@ -6,21 +6,51 @@ Before: ["Saint Laurent ivory trouser", "The Row brown tassel loafer"]
 After:  [{"name": "Saint Laurent ivory trouser", "category": "Bottoms"}, ...]
 """
 
-import json
+import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Counter as CounterType, Dict, List, Pattern, Tuple
 
 from config import SUMMER_CATEGORIES, DATA_FILES
+from json_io import dump_json, load_json
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; fall back to the regex patterns
+    ahocorasick = None
+
+# One case-insensitive alternation per category, checked in SUMMER_CATEGORIES order
+SUMMER_CATEGORY_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    (category, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for category, keywords in SUMMER_CATEGORIES.items()
+]
+
+# With pyahocorasick installed, one automaton over every keyword finds all
+# matches in a single pass; each keyword maps to its category's position in
+# SUMMER_CATEGORIES so the earliest category still wins
+SUMMER_CATEGORY_NAMES: List[str] = list(SUMMER_CATEGORIES)
+SUMMER_KEYWORD_AUTOMATON = None
+if ahocorasick is not None:
+    SUMMER_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for rank, keywords in enumerate(SUMMER_CATEGORIES.values()):
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if keyword not in SUMMER_KEYWORD_AUTOMATON:
+                SUMMER_KEYWORD_AUTOMATON.add_word(keyword, rank)
+    SUMMER_KEYWORD_AUTOMATON.make_automaton()
 
 
+@lru_cache(maxsize=4096)
 def categorize_summer_item(item_name: str) -> str:
-    """Categorize a summer item based on keywords."""
-    item_lower = item_name.lower()
+    """Categorize a summer item based on keywords (memoized; names repeat across pages)."""
+    if SUMMER_KEYWORD_AUTOMATON is not None:
+        ranks = [rank for _, rank in SUMMER_KEYWORD_AUTOMATON.iter(item_name.lower())]
+        return SUMMER_CATEGORY_NAMES[min(ranks)] if ranks else "Other"
 
-    for category, keywords in SUMMER_CATEGORIES.items():
-        for keyword in keywords:
-            if keyword in item_lower:
-                return category
+    for category, pattern in SUMMER_CATEGORY_PATTERNS:
+        if pattern.search(item_name):
+            return category
 
     return "Other"
 
@@ -30,47 +60,55 @@ def migrate_page_items() -> None:
     input_path = DATA_FILES["summer"]["page_items"]
 
     # Read existing data
-    with open(input_path, 'r') as f:
-        old_data: Dict[str, List[str]] = json.load(f)
+    old_data: Dict[str, List[str]] = load_json(input_path)
 
     # Convert to new format
     new_data: Dict[str, List[Dict[str, str]]] = {}
-    category_stats: Dict[str, int] = {}
+    category_stats: CounterType[str] = Counter()
+
+    # The same item recurs across many pages; share one dict per (name, category)
+    # (the JSON writer serializes by value, so shared references are safe)
+    item_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+    def make_item(name: str, category: str) -> Dict[str, str]:
+        item = item_cache.get((name, category))
+        if item is None:
+            item = item_cache[(name, category)] = {"name": name, "category": category}
+        return item
 
     for page_id, items in old_data.items():
+        if all(isinstance(item, dict) for item in items):
+            # Page already in new format: keep it as is and just count categories
+            new_data[page_id] = items
+            category_stats.update(item.get("category", "Other") for item in items)
+            continue
+
         new_items = []
         for item in items:
             if isinstance(item, str):
                 category = categorize_summer_item(item)
-                new_items.append({
-                    "name": item,
-                    "category": category
-                })
-                category_stats[category] = category_stats.get(category, 0) + 1
+                new_items.append(make_item(item, category))
+                category_stats[category] += 1
             elif isinstance(item, dict):
                 # Already in new format
                 new_items.append(item)
-                category_stats[item.get("category", "Other")] = \
-                    category_stats.get(item.get("category", "Other"), 0) + 1
+                category_stats[item.get("category", "Other")] += 1
         new_data[page_id] = new_items
 
     # Backup old file
     backup_path = input_path.with_suffix('.json.bak')
-    with open(backup_path, 'w') as f:
-        json.dump(old_data, f, indent=2)
+    dump_json(backup_path, old_data)
     print(f"✅ Backed up old format to {backup_path}")
 
     # Write new format
-    with open(input_path, 'w') as f:
-        json.dump(new_data, f, indent=2)
+    dump_json(input_path, new_data)
     print(f"✅ Migrated page_items.json to categorized format")
 
     # Write category stats
     stats_path = DATA_FILES["summer"].get("category_stats")
     if not stats_path:
         stats_path = Path("category_stats_summer.json")
-    with open(stats_path, 'w') as f:
-        json.dump(category_stats, f, indent=2)
+    dump_json(stats_path, category_stats)
     print(f"✅ Created category stats at {stats_path}")
 
     # Print summary
@@ -84,8 +122,7 @@ def migrate_clothing_index() -> None:
     input_path = DATA_FILES["summer"]["clothing_index"]
 
     # Read existing data
-    with open(input_path, 'r') as f:
-        old_data: Dict[str, List[str]] = json.load(f)
+    old_data: Dict[str, List[str]] = load_json(input_path)
 
     # Convert to new format with category in key
     new_data: Dict[str, List[str]] = {}
@@ -101,13 +138,11 @@ def migrate_clothing_index() -> None:
 
     # Backup old file
     backup_path = input_path.with_suffix('.json.bak')
-    with open(backup_path, 'w') as f:
-        json.dump(old_data, f, indent=2)
+    dump_json(backup_path, old_data)
     print(f"✅ Backed up old index to {backup_path}")
 
     # Write new format
-    with open(input_path, 'w') as f:
-        json.dump(new_data, f, indent=2)
+    dump_json(input_path, new_data)
     print(f"✅ Migrated clothing_index.json to categorized format")
 
 
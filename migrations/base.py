@@ -3,7 +3,7 @@
 Base migration class and utilities for data transformations.
 """
 
-import json
+import re
 import shutil
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -11,6 +11,22 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 
 from config import DATA_FILES, BASE_DIR
+import json_io
+from page_utils import page_sort_key
+
+
+def combine_merge_maps(*merge_maps: Dict[str, str]) -> Dict[str, str]:
+    """
+    Compose merge maps into one that gives the same result in a single pass
+    as applying each map in turn (a later map renaming an earlier map's
+    target is followed through).
+    """
+    combined: Dict[str, str] = {}
+    for merge_map in merge_maps:
+        combined = {old: merge_map.get(new, new) for old, new in combined.items()}
+        for old, new in merge_map.items():
+            combined.setdefault(old, new)
+    return combined
 
 
 class Migration(ABC):
@@ -20,10 +36,15 @@ class Migration(ABC):
     name: str = "unnamed_migration"
     description: str = "No description"
 
-    def __init__(self, dry_run: bool = True):
+    def __init__(self, dry_run: bool = True, backups: Optional[Dict[Path, Path]] = None):
         self.dry_run = dry_run
         self.changes: List[str] = []
         self.backup_dir: Optional[Path] = None
+        # Files already backed up -> backup path. Pass the same dict to each
+        # migration in a session so a file is only copied before the first one.
+        self._backed_up: Dict[Path, Path] = backups if backups is not None else {}
+        # Backups taken by an earlier migration in the session that this one reused
+        self._reused_backups: Set[Path] = set()
 
     @abstractmethod
     def migrate(self) -> bool:
@@ -37,7 +58,12 @@ class Migration(ABC):
         print(f"{prefix}{message}")
 
     def backup_file(self, file_path: Path) -> Path:
-        """Create a backup of a file before modifying."""
+        """Create a backup of a file before modifying (once per session)."""
+        if file_path in self._backed_up:
+            backup_path = self._backed_up[file_path]
+            self._reused_backups.add(backup_path)
+            return backup_path
+
         if self.backup_dir is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.backup_dir = BASE_DIR / "backups" / f"{self.name}_{timestamp}"
@@ -46,21 +72,21 @@ class Migration(ABC):
         backup_path = self.backup_dir / file_path.name
         if not self.dry_run:
             shutil.copy2(file_path, backup_path)
+        self._backed_up[file_path] = backup_path
         return backup_path
 
     def load_json(self, file_path: Path) -> Dict:
         """Load a JSON file."""
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return json_io.load_json(file_path)
 
     def save_json(self, file_path: Path, data: Dict) -> None:
         """Save data to a JSON file (respects dry_run)."""
         if self.dry_run:
             self.log(f"Would save to {file_path}")
-        else:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+        elif json_io.dump_json(file_path, data):
             self.log(f"Saved {file_path}")
+        else:
+            self.log(f"Unchanged {file_path}")
 
     def run(self) -> bool:
         """Run the migration with proper setup/teardown."""
@@ -80,6 +106,8 @@ class Migration(ABC):
                 print(f"Migration completed successfully!")
                 if self.backup_dir:
                     print(f"Backups saved to: {self.backup_dir}")
+                for backup_dir in sorted({path.parent for path in self._reused_backups}):
+                    print(f"Pre-session backups in: {backup_dir}")
         else:
             print(f"Migration failed!")
         print(f"{'='*60}\n")
@@ -130,6 +158,9 @@ class MergeItemsMigration(Migration):
     def _merge_index(self, index: Dict) -> Dict:
         """Merge items in the clothing index."""
         new_index = {}
+        # Deduplicated pages (-> sort key) of entries that received a merge,
+        # sorted once at the end
+        merged_pages: Dict[str, Dict[Any, int]] = {}
 
         for item, pages in index.items():
             # Check if this item should be merged
@@ -140,35 +171,48 @@ class MergeItemsMigration(Migration):
 
             if new_name in new_index:
                 # Merge pages
-                existing = set(new_index[new_name])
-                new_index[new_name] = sorted(existing | set(pages), key=self._page_sort_key)
+                page_keys = merged_pages.get(new_name)
+                if page_keys is None:
+                    page_keys = merged_pages[new_name] = {}
+                    self._add_page_keys(page_keys, new_index[new_name])
+                self._add_page_keys(page_keys, pages)
             else:
                 new_index[new_name] = pages
 
+        for name, page_keys in merged_pages.items():
+            # Keys were computed once per page; the sort only does dict lookups
+            new_index[name] = sorted(page_keys, key=page_keys.__getitem__)
+
         return new_index
 
+    def _add_page_keys(self, page_keys: Dict[Any, int], pages: List) -> None:
+        """Add pages not seen yet to page_keys, mapped to their sort key."""
+        sort_key = self._page_sort_key
+        for page in pages:
+            if page not in page_keys:
+                page_keys[page] = sort_key(page)
+
     def _update_page_items(self, page_items: Dict) -> Dict:
         """Update item names in page_items."""
-        for page, items in page_items.items():
+        if not self.merge_map:
+            return page_items
+
+        # Most items aren't renamed: a membership test (no call, no default
+        # argument, no comparison) rules them out, and only hits are looked up
+        merge_map = self.merge_map
+        for items in page_items.values():
             for i, item_data in enumerate(items):
-                if isinstance(item_data, dict) and 'name' in item_data:
-                    old_name = item_data['name']
-                    new_name = self.merge_map.get(old_name, old_name)
-                    if new_name != old_name:
-                        items[i]['name'] = new_name
+                if isinstance(item_data, dict):
+                    if 'name' in item_data and item_data['name'] in merge_map:
+                        item_data['name'] = merge_map[item_data['name']]
                 elif isinstance(item_data, str):
-                    new_name = self.merge_map.get(item_data, item_data)
-                    if new_name != item_data:
-                        items[i] = new_name
+                    if item_data in merge_map:
+                        items[i] = merge_map[item_data]
         return page_items
 
     def _page_sort_key(self, page) -> int:
         """Sort key for pages - handles both string and int formats."""
-        if isinstance(page, int):
-            return page
-        if isinstance(page, str) and page.startswith("page_"):
-            return int(page.split("_")[1])
-        return 0
+        return page_sort_key(page)
 
 
 class RenameItemMigration(MergeItemsMigration):
@@ -177,14 +221,19 @@ class RenameItemMigration(MergeItemsMigration):
     old_name: str = ""
     new_name: str = ""
 
-    def __init__(self, dry_run: bool = True):
-        super().__init__(dry_run)
+    def __init__(self, dry_run: bool = True, backups: Optional[Dict[Path, Path]] = None):
+        super().__init__(dry_run, backups)
         if self.old_name and self.new_name:
             self.merge_map = {self.old_name: self.new_name}
 
 
-class CleanOCRArtifactsMigration(Migration):
-    """Migration to clean OCR artifacts from item names."""
+class CleanOCRArtifactsMigration(MergeItemsMigration):
+    """
+    Migration to clean OCR artifacts from item names.
+
+    Builds its merge map from the index, then applies it with the inherited
+    MergeItemsMigration helpers.
+    """
 
     name = "clean_ocr_artifacts"
     description = "Remove common OCR artifacts from item names"
@@ -198,6 +247,19 @@ class CleanOCRArtifactsMigration(Migration):
         ("| ", ""),
     ]
 
+    def __init__(self, dry_run: bool = True, backups: Optional[Dict[Path, Path]] = None):
+        super().__init__(dry_run, backups)
+        # One anchored match for the whole prefix scan: each artifact is optional
+        # and tried in list order, the same as stripping them one after another.
+        # A non-empty replacement would be rescanned by later prefixes, so that
+        # case keeps the step-by-step loop.
+        self.artifact_re = None
+        if not any(replacement for _, replacement in self.artifacts):
+            self.artifact_re = re.compile(
+                "^" + "".join(f"(?:{re.escape(prefix)})?" for prefix, _ in self.artifacts),
+                re.IGNORECASE,
+            )
+
     def migrate(self) -> bool:
         files = DATA_FILES.get(self.collection, {})
         if not files:
@@ -212,9 +274,10 @@ class CleanOCRArtifactsMigration(Migration):
         index = self.load_json(index_path)
         page_items = self.load_json(page_items_path)
 
-        # Build merge map from artifacts
+        # Build merge map from artifacts (index is only read here, so iterate it
+        # directly; renames are collected and applied in the merge pass below)
         merge_map = {}
-        for item in list(index.keys()):
+        for item in index:
             cleaned = self._clean_item(item)
             if cleaned != item:
                 merge_map[item] = cleaned
@@ -222,12 +285,8 @@ class CleanOCRArtifactsMigration(Migration):
 
         # Apply merges
         self.merge_map = merge_map
-        merger = MergeItemsMigration(self.dry_run)
-        merger.merge_map = merge_map
-        merger.collection = self.collection
-
-        new_index = merger._merge_index(index)
-        new_page_items = merger._update_page_items(page_items)
+        new_index = self._merge_index(index)
+        new_page_items = self._update_page_items(page_items)
 
         self.save_json(index_path, new_index)
         self.save_json(page_items_path, new_page_items)
@@ -236,6 +295,9 @@ class CleanOCRArtifactsMigration(Migration):
 
     def _clean_item(self, item: str) -> str:
         """Clean an item name of OCR artifacts."""
+        if self.artifact_re is not None:
+            return item[self.artifact_re.match(item).end():].strip()
+
         cleaned = item
         for prefix, replacement in self.artifacts:
             if cleaned.lower().startswith(prefix):
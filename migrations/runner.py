@@ -3,16 +3,21 @@
 Migration runner - execute data migrations.
 
 Usage:
-    python -m migrations.runner <migration_name> [--live]
+    python -m migrations.runner <migration_name> [<migration_name> ...] [--live] [--jobs N]
 
 Examples:
     python -m migrations.runner clean_ocr --dry-run
     python -m migrations.runner merge_loro_piana --live
+    python -m migrations.runner clean_summer_ocr clean_spring_ocr clean_fw_ocr --live --jobs 3
 """
 
+import io
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Add parent dir to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,6 +27,7 @@ from migrations.base import (
     MergeItemsMigration,
     RenameItemMigration,
     CleanOCRArtifactsMigration,
+    combine_merge_maps,
 )
 
 
@@ -68,6 +74,38 @@ class UpdateCoatToTrenchMigration(RenameItemMigration):
     new_name = "Saint Laurent trench coat"
 
 
+class UpdateLoroPianaCoatMigration(RenameItemMigration):
+    """Update Loro Piana coat."""
+    name = "update_loro_piana_coat"
+    description = "Update 'Loro Piana Coat' -> 'Loro Piana Navy coat'"
+    collection = "fw"
+    old_name = "Loro Piana Coat"
+    new_name = "Loro Piana Navy coat"
+
+
+class UpdateCoatsMigration(MergeItemsMigration):
+    """Apply the Fall/Winter coat renames above in a single load/save pass."""
+    name = "update_coats"
+    description = "Apply the Saint Laurent and Loro Piana coat renames in one pass"
+    collection = "fw"
+    merge_map = combine_merge_maps(
+        {UpdateCoatToTrenchMigration.old_name: UpdateCoatToTrenchMigration.new_name},
+        {UpdateLoroPianaCoatMigration.old_name: UpdateLoroPianaCoatMigration.new_name},
+    )
+
+
+class MergeFWVariantsMigration(MergeItemsMigration):
+    """Apply the Fall/Winter variant merges above in a single load/save pass."""
+    name = "merge_fw_variants"
+    description = "Merge Loro Piana blazer, woolly trouser and mislabeled blazer variants in one pass"
+    collection = "fw"
+    merge_map = combine_merge_maps(
+        MergeLoroPianaBlazersMigration.merge_map,
+        MergeWoollyTrousersMigration.merge_map,
+        {FixMislabeledBlazerMigration.old_name: FixMislabeledBlazerMigration.new_name},
+    )
+
+
 class CleanFWArtifactsMigration(CleanOCRArtifactsMigration):
     """Clean OCR artifacts from Fall/Winter collection."""
     name = "clean_fw_ocr"
@@ -95,6 +133,9 @@ MIGRATIONS = {
     "merge_woolly_trousers": MergeWoollyTrousersMigration,
     "fix_mislabeled_blazer": FixMislabeledBlazerMigration,
     "update_coat_to_trench": UpdateCoatToTrenchMigration,
+    "update_loro_piana_coat": UpdateLoroPianaCoatMigration,
+    "update_coats": UpdateCoatsMigration,
+    "merge_fw_variants": MergeFWVariantsMigration,
     "clean_fw_ocr": CleanFWArtifactsMigration,
     "clean_summer_ocr": CleanSummerArtifactsMigration,
     "clean_spring_ocr": CleanSpringArtifactsMigration,
@@ -110,23 +151,76 @@ def list_migrations():
     print()
 
 
-def run_migration(name: str, live: bool = False) -> bool:
-    """Run a specific migration."""
+def run_migration(name: str, live: bool = False,
+                  backups: Optional[Dict[Path, Path]] = None) -> bool:
+    """Run a specific migration, sharing the backups dict if one is given."""
     if name not in MIGRATIONS:
         print(f"Unknown migration: {name}")
         list_migrations()
         return False
 
     migration_cls = MIGRATIONS[name]
-    migration = migration_cls(dry_run=not live)
+    migration = migration_cls(dry_run=not live, backups=backups)
     return migration.run()
 
 
+def run_migrations(names: List[str], live: bool = False) -> bool:
+    """
+    Run migrations in order, stopping at the first failure.
+
+    Each data file is backed up only before the first migration that touches
+    it, so the backups hold the data as it was before the whole run.
+    """
+    backups: Dict[Path, Path] = {}
+    for name in names:
+        if not run_migration(name, live=live, backups=backups):
+            return False
+    return True
+
+
+def _run_migrations_captured(names: List[str], live: bool) -> Tuple[bool, str]:
+    """Worker: run migrations in order, returning success and their captured output."""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        success = run_migrations(names, live=live)
+    return success, output.getvalue()
+
+
+def run_migrations_parallel(names: List[str], live: bool = False, jobs: int = 2) -> bool:
+    """
+    Run migrations on different collections in parallel processes.
+
+    Each collection has its own data files, so only migrations on the same
+    collection depend on each other; those stay in order within one worker.
+    Output is printed per collection once all workers finish.
+    """
+    unknown = [name for name in names if name not in MIGRATIONS]
+    if unknown:
+        print(f"Unknown migration: {', '.join(unknown)}")
+        list_migrations()
+        return False
+
+    by_collection: Dict[str, List[str]] = {}
+    for name in names:
+        by_collection.setdefault(MIGRATIONS[name].collection, []).append(name)
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(by_collection))) as executor:
+        futures = [executor.submit(_run_migrations_captured, group, live)
+                   for group in by_collection.values()]
+        results = [future.result() for future in futures]
+
+    for _, output in results:
+        print(output, end="")
+    return all(success for success, _ in results)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run data migrations")
-    parser.add_argument("migration", nargs="?", help="Migration name to run")
+    parser.add_argument("migration", nargs="*", help="Migration name(s) to run, in order")
     parser.add_argument("--live", action="store_true", help="Apply changes (default is dry-run)")
     parser.add_argument("--list", action="store_true", help="List available migrations")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Run migrations on different collections in up to N processes")
 
     args = parser.parse_args()
 
@@ -134,7 +228,10 @@ def main():
         list_migrations()
         return
 
-    success = run_migration(args.migration, live=args.live)
+    if args.jobs > 1 and len(args.migration) > 1:
+        success = run_migrations_parallel(args.migration, live=args.live, jobs=args.jobs)
+    else:
+        success = run_migrations(args.migration, live=args.live)
     sys.exit(0 if success else 1)
 
 
@@ -3,7 +3,8 @@
 Pydantic models for data validation in Kevin's Outfit Finder.
 """
 
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Counter as CounterType, Dict, Iterable, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -80,12 +81,16 @@ class CollectionData(BaseModel):
 
 class CategoryStats(BaseModel):
     """Statistics for clothing categories."""
-    stats: Dict[str, int] = Field(default_factory=dict)
+    stats: CounterType[str] = Field(default_factory=Counter)
 
     def increment(self, category: str) -> None:
         """Increment count for a category."""
-        self.stats[category] = self.stats.get(category, 0) + 1
+        self.stats[category] += 1
+
+    def update(self, categories: Iterable[str]) -> None:
+        """Count every category in an iterable in one pass."""
+        self.stats.update(categories)
 
     def get_sorted(self) -> List[tuple]:
         """Get categories sorted by count descending."""
-        return sorted(self.stats.items(), key=lambda x: x[1], reverse=True)
+        return self.stats.most_common()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Page id helpers shared by the data cleaning scripts and migrations.
+"""
+
+import sys
+from typing import Union
+
+
+def page_sort_key(page: Union[int, str]) -> int:
+    """
+    Numeric sort key for a page id.
+
+    Handles both formats found in the data files: int page numbers pass
+    through and "page_N" strings are parsed; anything else sorts first.
+    """
+    if isinstance(page, int):
+        return page
+    if isinstance(page, str) and page.startswith("page_"):
+        return int(page.split("_", 1)[1])
+    return 0
+
+
+def intern_page(page: Union[int, str]) -> Union[int, str]:
+    """
+    Intern a "page_N" id so equal ids loaded from JSON share one object
+    (merges then hash it once and compare by identity). Int ids pass through.
+    """
+    return sys.intern(page) if isinstance(page, str) else page
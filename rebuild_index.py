@@ -3,37 +3,51 @@
 Rebuild clothing_index.json from the manually updated page_items.json
 """
 
-import json
 from collections import defaultdict
 
+from json_io import dump_json, load_json
+from page_utils import page_sort_key
+
+try:
+    import ijson
+except ImportError:  # optional; fall back to loading the whole file
+    ijson = None
+
+def iter_page_items(path):
+    """Yield (page, items) pairs, streamed one page at a time when ijson is installed"""
+    if ijson is None:
+        yield from load_json(path).items()
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.kvitems(f, '')
+
 def rebuild_clothing_index():
     """Rebuild the clothing index from page items"""
     
-    # Load the updated page items
-    with open('page_items.json', 'r') as f:
-        page_items = json.load(f)
+    # Build new clothing index, reading the updated page items page by page.
+    # Each page number is parsed once and stored with the page, so the sort
+    # below compares plain tuples instead of calling a key function.
+    item_pages = defaultdict(list)
+    page_count = 0
     
-    # Build new clothing index
-    clothing_index = defaultdict(list)
-    
-    for page, items in page_items.items():
+    for page, items in iter_page_items('page_items.json'):
+        page_count += 1
+        entry = (page_sort_key(page), page)
         for item in items:
-            clothing_index[item].append(page)
-    
-    # Sort pages for each item
-    for item in clothing_index:
-        clothing_index[item].sort(key=lambda x: int(x.split('_')[1]))
+            item_pages[item].append(entry)
     
-    # Convert to regular dict and sort by frequency
-    clothing_index = dict(clothing_index)
+    # Sort pages for each item, building the final plain dict in the same pass
+    clothing_index = {}
+    for item, pages in item_pages.items():
+        pages.sort()
+        clothing_index[item] = [page for _, page in pages]
     
     # Save the rebuilt index
-    with open('clothing_index.json', 'w') as f:
-        json.dump(clothing_index, f, indent=2)
+    dump_json('clothing_index.json', clothing_index)
     
     # Show statistics
     print("🔄 Rebuilt clothing index from page items!")
-    print(f"📊 Found {len(clothing_index)} unique items across {len(page_items)} pages")
+    print(f"📊 Found {len(clothing_index)} unique items across {page_count} pages")
     
     # Show top items
     sorted_items = sorted(clothing_index.items(), key=lambda x: len(x[1]), reverse=True)
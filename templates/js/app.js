@@ -6,8 +6,39 @@ let currentClothingIndex = null;
 let currentPageItems = null;
 let currentCategory = 'all';
 
-// Data will be injected by template
-// const summerClothingIndex, summerPageItems, etc.
+// View containers, looked up once (the script runs after the markup)
+const VIEWS = Object.fromEntries(
+    ['summer', 'spring', 'fall', 'winter', 'item', 'page']
+        .map(name => [name, document.getElementById(name + '-view')])
+);
+
+function showView(name) {
+    Object.values(VIEWS).forEach(view => view.classList.add('hidden'));
+    VIEWS[name].classList.remove('hidden');
+}
+
+// Collection data is fetched on first use from data/<collection>_index.json
+// and data/<collection>_items.json; keyed by collection, caches the promise
+const collectionData = {};
+
+function loadCollectionData(collection) {
+    if (!collectionData[collection]) {
+        const fetchJson = url => fetch(url).then(response => {
+            if (!response.ok) throw new Error('Failed to load ' + url);
+            return response.json();
+        });
+        collectionData[collection] = Promise.all([
+            fetchJson('data/' + collection + '_index.json'),
+            fetchJson('data/' + collection + '_items.json'),
+        ]).then(([clothingIndex, pageItems]) => ({ clothingIndex, pageItems }))
+          .catch(error => {
+              // Allow a retry on the next navigation
+              delete collectionData[collection];
+              throw error;
+          });
+    }
+    return collectionData[collection];
+}
 
 // Fuzzy Search Implementation
 function levenshteinDistance(str1, str2) {
@@ -97,35 +128,20 @@ function closeModal() {
 function showCollection(collection) {
     currentCollection = collection;
 
-    // Hide all views
-    document.getElementById('summer-view').classList.add('hidden');
-    document.getElementById('spring-view').classList.add('hidden');
-    document.getElementById('fall-view').classList.add('hidden');
-    document.getElementById('winter-view').classList.add('hidden');
-    document.getElementById('item-view').classList.add('hidden');
-    document.getElementById('page-view').classList.add('hidden');
-
-    // Show selected collection
-    document.getElementById(collection + '-view').classList.remove('hidden');
+    // Show selected collection, hiding all other views
+    showView(collection);
 
     // Update navigation
     document.querySelectorAll('.nav button').forEach(btn => btn.classList.remove('active'));
     document.getElementById('nav-' + collection).classList.add('active');
 
-    // Update current data
-    if (collection === 'summer') {
-        currentClothingIndex = summerClothingIndex;
-        currentPageItems = summerPageItems;
-    } else if (collection === 'spring') {
-        currentClothingIndex = springClothingIndex;
-        currentPageItems = springPageItems;
-    } else if (collection === 'fall') {
-        currentClothingIndex = fallClothingIndex;
-        currentPageItems = fallPageItems;
-    } else if (collection === 'winter') {
-        currentClothingIndex = winterClothingIndex;
-        currentPageItems = winterPageItems;
-    }
+    // Update current data (fetched the first time a collection is shown)
+    loadCollectionData(collection).then(data => {
+        if (currentCollection === collection) {
+            currentClothingIndex = data.clothingIndex;
+            currentPageItems = data.pageItems;
+        }
+    }).catch(error => console.error(error));
 
     // Update browser title
     document.title = "Kevin's Outfit Finder";
@@ -202,22 +218,9 @@ function filterItems(collection) {
 }
 
 // Show item detail
-function showItemDetail(itemName, collection, imageFolder) {
+async function showItemDetail(itemName, collection, imageFolder) {
     // Determine which index to use based on collection name
-    let clothingIndex, pageItems;
-    if (collection === 'Summer') {
-        clothingIndex = summerClothingIndex;
-        pageItems = summerPageItems;
-    } else if (collection === 'Spring') {
-        clothingIndex = springClothingIndex;
-        pageItems = springPageItems;
-    } else if (collection === 'Fall') {
-        clothingIndex = fallClothingIndex;
-        pageItems = fallPageItems;
-    } else if (collection === 'Winter') {
-        clothingIndex = winterClothingIndex;
-        pageItems = winterPageItems;
-    }
+    const { clothingIndex } = await loadCollectionData(collection.toLowerCase());
 
     // Try to find the item with or without category suffix
     let pages = null;
@@ -234,12 +237,7 @@ function showItemDetail(itemName, collection, imageFolder) {
     }
 
     // Hide other views
-    document.getElementById('summer-view').classList.add('hidden');
-    document.getElementById('spring-view').classList.add('hidden');
-    document.getElementById('fall-view').classList.add('hidden');
-    document.getElementById('winter-view').classList.add('hidden');
-    document.getElementById('page-view').classList.add('hidden');
-    document.getElementById('item-view').classList.remove('hidden');
+    showView('item');
 
     document.title = itemName + ' - ' + collection + ' Collection';
 
@@ -264,29 +262,15 @@ function showItemDetail(itemName, collection, imageFolder) {
 }
 
 // Show page detail
-function showPageDetail(pageName, collection, imageFolder) {
-    let pageItems;
-    if (collection === 'Summer') {
-        pageItems = summerPageItems;
-    } else if (collection === 'Spring') {
-        pageItems = springPageItems;
-    } else if (collection === 'Fall') {
-        pageItems = fallPageItems;
-    } else if (collection === 'Winter') {
-        pageItems = winterPageItems;
-    }
+async function showPageDetail(pageName, collection, imageFolder) {
+    const { pageItems } = await loadCollectionData(collection.toLowerCase());
 
     if (!pageItems[pageName]) return;
 
     const items = pageItems[pageName];
 
     // Hide other views
-    document.getElementById('summer-view').classList.add('hidden');
-    document.getElementById('spring-view').classList.add('hidden');
-    document.getElementById('fall-view').classList.add('hidden');
-    document.getElementById('winter-view').classList.add('hidden');
-    document.getElementById('item-view').classList.add('hidden');
-    document.getElementById('page-view').classList.remove('hidden');
+    showView('page');
 
     document.title = pageName.replace('page_', 'Page ') + ' - ' + collection + ' Collection';
 